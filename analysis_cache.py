@@ -0,0 +1,93 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from fileio import load_json_file, save_json_file
+
+# Bump when the experience/level rules change so cached results are discarded
+RULESET_VERSION = '1'
+
+class AnalysisCache:
+    """Bounded LRU of per-posting analysis results, optionally persisted to disk."""
+
+    def __init__(self, max_entries: int = 100000, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.ruleset_version = RULESET_VERSION
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, namespace: str, title: str, description: str) -> str:
+        text = f"{self.ruleset_version}\0{namespace}\0{title}\0{description}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get_or_compute(self, namespace: str, title: str, description: str,
+                       compute: Callable[[str, str], Any]) -> Any:
+        """Return the cached result for this title+description, computing it on a miss."""
+        key = self.key(namespace, title, description)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute(title, description)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def set_ruleset_version(self, version: str):
+        """Switch ruleset versions, dropping entries computed under the old one."""
+        with self._lock:
+            if version != self.ruleset_version:
+                self.ruleset_version = version
+                self._entries.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load(self):
+        """Load persisted entries, ignoring a missing, corrupt or outdated file."""
+        data = load_json_file(self.path, 'analysis cache', {})
+        if data.get('ruleset_version') != self.ruleset_version:
+            return
+        with self._lock:
+            for key, value in list(data.get('entries', {}).items())[-self.max_entries:]:
+                self._entries[key] = value
+
+    def save(self):
+        """Persist entries, least recently used first."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {'ruleset_version': self.ruleset_version, 'entries': dict(self._entries)}
+        save_json_file(self.path, data, 'analysis cache')
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+# Shared cache used by utils and filters
+analysis_cache = AnalysisCache()
+
+def configure_analysis_cache(settings: Dict, rules_fingerprint: Optional[str] = None) -> AnalysisCache:
+    """Apply the 'cache' settings section to the shared cache and load it from disk.
+    
+    rules_fingerprint ties cached results to the compiled filter rules.
+    """
+    analysis_cache.max_entries = settings.get('analysis_max_entries', 100000)
+    analysis_cache.path = settings.get('analysis_file', '.cache/analysis.json')
+    analysis_cache.clear()
+    if rules_fingerprint:
+        analysis_cache.set_ruleset_version(f"{RULESET_VERSION}:{rules_fingerprint[:16]}")
+    analysis_cache.load()
+    return analysis_cache
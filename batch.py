@@ -0,0 +1,98 @@
+import re
+import numpy as np
+import pandas as pd
+import json_backend
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from utils import US_INDICATORS, US_STATES, INTERNSHIP_KEYWORDS, is_recent_posting
+
+# Columns every job batch carries, in output order
+COLUMNS = ['title', 'company', 'location', 'url', 'posted_date', 'provider', 'description']
+
+# Columns of a filtered batch (see JobFilter.filter_jobs)
+FILTERED_COLUMNS = COLUMNS + ['role_category', 'level']
+
+# Vectorized equivalents of is_us_location and has_internship_keywords, built from the same lists
+US_LOCATION_PATTERN = re.compile(
+    '|'.join(re.escape(indicator) for indicator in US_INDICATORS) + r'|\b(?:' + '|'.join(US_STATES) + r')\b'
+)
+INTERNSHIP_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in INTERNSHIP_KEYWORDS))
+
+def _string_dtype():
+    """Arrow-backed strings when pyarrow is installed, else pandas' default string dtype."""
+    try:
+        import pyarrow  # noqa: F401
+        return pd.StringDtype('pyarrow')
+    except ImportError:
+        return pd.StringDtype()
+
+class JobBatch:
+    """Column-oriented batch of jobs backed by a pandas DataFrame.
+
+    String columns use (Arrow-backed when available) string arrays; posted_date
+    stays an object column because providers mix ISO strings and epoch ints.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+
+    @classmethod
+    def from_records(cls, records: List[Dict], columns: Optional[List[str]] = None) -> 'JobBatch':
+        columns = columns or COLUMNS
+        frame = pd.DataFrame.from_records(records, columns=columns) if records else pd.DataFrame(columns=columns)
+        string_dtype = _string_dtype()
+        for column in columns:
+            if column == 'posted_date':
+                frame[column] = frame[column].astype(object).where(frame[column].notna(), '')
+            else:
+                frame[column] = frame[column].fillna('').astype(str).astype(string_dtype)
+        return cls(frame)
+
+    @classmethod
+    def concat(cls, batches: Iterable['JobBatch'], columns: Optional[List[str]] = None) -> 'JobBatch':
+        frames = [batch.frame for batch in batches if len(batch)]
+        if not frames:
+            return cls.from_records([], columns)
+        return cls(pd.concat(frames, ignore_index=True))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def take(self, mask) -> 'JobBatch':
+        return JobBatch(self.frame[np.asarray(mask, dtype=bool)].reset_index(drop=True))
+
+    def to_records(self) -> List[Dict]:
+        return self.frame.to_dict('records')
+
+    def recent_mask(self, now: Optional[datetime] = None) -> np.ndarray:
+        """is_recent_posting over the column, parsing each distinct date only once."""
+        now = now or datetime.now()
+        codes, uniques = pd.factorize(self.frame['posted_date'], use_na_sentinel=False)
+        keep = np.fromiter((is_recent_posting(value, now) for value in uniques), dtype=bool, count=len(uniques))
+        return keep[codes]
+
+    def internship_mask(self) -> np.ndarray:
+        text = (self.frame['title'] + ' ' + self.frame['description']).str.lower()
+        return text.str.contains(INTERNSHIP_PATTERN, regex=True).to_numpy(dtype=bool)
+
+    def us_location_mask(self) -> np.ndarray:
+        location = self.frame['location'].str.lower().str.strip()
+        return location.str.contains(US_LOCATION_PATTERN, regex=True).to_numpy(dtype=bool)
+
+    def location_mask(self, rules=None) -> np.ndarray:
+        """Vectorized RuleSet.matches_location (or is_us_location without rules)."""
+        if rules is None:
+            return self.us_location_mask()
+        mask = np.zeros(len(self), dtype=bool)
+        if rules.use_builtin_rules:
+            mask |= self.us_location_mask()
+        if rules.location_pattern is not None:
+            mask |= self.frame['location'].str.contains(rules.location_pattern, regex=True).to_numpy(dtype=bool)
+        return mask & (self.frame['location'].str.len() > 0).to_numpy(dtype=bool)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize through json_backend so the bytes match save_json exactly."""
+        return json_backend.dumps(self.to_records(), indent=True)
+
+    def to_csv_bytes(self) -> bytes:
+        return self.frame.to_csv(index=False).encode('utf-8')
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import importlib
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Tuple
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import (load_yaml, classify_role_by_title, is_us_location, has_internship_keywords,
+                   analyze_experience_requirements, _analyze_experience_requirements, is_relevant_job)
+import json_backend
+from analysis_cache import analysis_cache
+from filters import JobFilter
+from rules import RuleSet
+from batch import JobBatch
+from pipeline import finalize_jobs
+
+SENIORITY = ['', '', '', 'Senior ', 'Sr. ', 'Staff ', 'Principal ', 'Lead ', 'Junior ', 'Associate ', 'New Grad ', 'Entry Level ']
+LEVEL_SUFFIXES = ['', '', '', ' I', ' II', ' III', ' 1', ' 2', ', Early Career']
+EXTRA_TITLES = ['Software Engineering Intern', 'Security Analyst Co-op', 'Product Manager', 'Account Executive',
+                'Recruiter', 'Data Scientist', 'Engineering Manager', 'Apprentice Developer']
+FOREIGN_LOCATIONS = ['London, UK', 'Toronto, Ontario, Canada', 'Berlin, Germany', 'Bangalore, India', 'Remote - EMEA',
+                     'Dublin, Ireland', 'Sydney, Australia', 'Paris, France', 'Singapore', 'São Paulo, Brazil']
+DESCRIPTION_PARTS = [
+    "We are looking for an engineer to join our {team} team.",
+    "You will build and operate services used by millions of customers.",
+    "{years}+ years of experience with {skill} required.",
+    "Minimum {years} years of professional experience.",
+    "At least {years} years with distributed systems.",
+    "0-1 years of experience; new grads welcome.",
+    "This is an entry level role for recent graduates.",
+    "Experience with {skill} preferred.",
+    "This summer internship runs for 12 weeks.",
+    "Join our fellowship program for early career engineers.",
+    "Bachelor's degree in Computer Science or related field.",
+    "Competitive salary, equity and benefits."
+]
+# Probes for the superset checks: accepted only through settings.yml additions, or never acceptable
+CONFIGURED_ONLY_LOCATIONS = ['US', 'Remote - US', 'Remote, US']
+CONFIGURED_ONLY_TITLES = ['Full Stack', 'Site Reliability, New Grad', 'Machine Learning Scientist', 'Cyber Security Team']
+NON_TECH_TITLES = ['Product Manager', 'Account Executive', 'Recruiter']
+TEAMS = ['Platform', 'Payments', 'Security', 'Infrastructure', 'Growth', 'Detection & Response', 'Mobile']
+SKILLS = ['Python', 'Go', 'Kubernetes', 'AWS', 'React', 'SIEM tooling', 'Rust', 'SQL']
+
+def load_shapes(path: str) -> Tuple[List[str], List[str]]:
+    """Titles and locations from an existing jobs.json, used as the corpus vocabulary."""
+    try:
+        with open(path, 'r') as f:
+            jobs = json.load(f)
+    except (OSError, ValueError):
+        jobs = []
+    titles = sorted({job.get('title', '').strip() for job in jobs if job.get('title')}) or ['Software Engineer']
+    locations = sorted({job.get('location', '') for job in jobs if job.get('location')}) or ['San Francisco, CA']
+    return titles, locations
+
+def generate_corpus(size: int, seed: int, shapes_path: str) -> List[Dict]:
+    """Build a reproducible synthetic corpus shaped like real postings.
+
+    Strings are drawn from bounded pools so 1M-job corpora stay in memory.
+    """
+    rng = random.Random(seed)
+    titles, locations = load_shapes(shapes_path)
+
+    title_pool = []
+    for _ in range(min(size, 20000)):
+        base = rng.choice(titles) if rng.random() < 0.9 else rng.choice(EXTRA_TITLES)
+        title_pool.append(f"{rng.choice(SENIORITY)}{base}{rng.choice(LEVEL_SUFFIXES)}".strip())
+
+    location_pool = locations + FOREIGN_LOCATIONS + ['Remote', 'Remote (US)', 'United States', '']
+
+    description_pool = []
+    for _ in range(min(size, 5000)):
+        parts = rng.sample(DESCRIPTION_PARTS, rng.randint(0, 5))
+        description_pool.append(' '.join(part.format(team=rng.choice(TEAMS), skill=rng.choice(SKILLS),
+                                                     years=rng.randint(1, 8)) for part in parts))
+
+    now = datetime(2025, 10, 15, tzinfo=timezone.utc)
+    date_pool = []
+    for _ in range(min(size, 2000)):
+        posted = now - timedelta(days=rng.randint(0, 150), seconds=rng.randint(0, 86400))
+        style = rng.random()
+        if style < 0.5:
+            date_pool.append(posted.astimezone(timezone(timedelta(hours=-4))).isoformat(timespec='seconds'))
+        elif style < 0.7:
+            date_pool.append(posted.strftime('%Y-%m-%dT%H:%M:%S.000Z'))
+        elif style < 0.85:
+            date_pool.append(posted.replace(tzinfo=None).isoformat())
+        elif style < 0.95:
+            date_pool.append(int(posted.timestamp() * 1000))  # Lever-style epoch millis
+        else:
+            date_pool.append('')
+
+    return [{
+        'title': rng.choice(title_pool),
+        'company': f"company{rng.randint(1, 500)}",
+        'location': rng.choice(location_pool),
+        'url': f"https://example.com/jobs/{i}",
+        'posted_date': rng.choice(date_pool),
+        'provider': 'synthetic',
+        'description': rng.choice(description_pool)
+    } for i in range(size)]
+
+def build_benchmarks(settings: Dict) -> Dict[str, Callable[[Dict], object]]:
+    """Per-job callables; analysis functions are timed uncached so numbers reflect the regex cost."""
+    job_filter = JobFilter(settings)
+    return {
+        'classify_role_by_title': lambda job: classify_role_by_title(job['title']),
+        'is_us_location': lambda job: is_us_location(job['location']),
+        'has_internship_keywords': lambda job: has_internship_keywords(job['title'], job['description']),
+        'analyze_experience_requirements': lambda job: _analyze_experience_requirements(job['title'], job['description']),
+        'JobFilter.determine_level': lambda job: job_filter._determine_level(job['title'], job['description']),
+        'is_relevant_job': lambda job: is_relevant_job(dict(job), settings, job_filter.rules)
+    }
+
+def run_benchmarks(corpus: List[Dict], benchmarks: Dict[str, Callable], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, func in benchmarks.items():
+        best = float('inf')
+        for _ in range(repeat):
+            analysis_cache.clear()
+            started = time.perf_counter()
+            for job in corpus:
+                func(job)
+            best = min(best, time.perf_counter() - started)
+        results[name] = {
+            'ns_per_op': best / len(corpus) * 1e9,
+            'jobs_per_sec': len(corpus) / best if best else float('inf')
+        }
+        print(f"  {name:<34} {results[name]['ns_per_op']:>12.0f} ns/op  {results[name]['jobs_per_sec']:>12.0f} jobs/sec")
+    return results
+
+def compare_to_baseline(results: Dict[str, Dict[str, float]], baseline_path: str, tolerance: float) -> bool:
+    """Print the change against a stored baseline; returns False if anything regressed past tolerance."""
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    ok = True
+    print(f"\nCompared to {baseline_path} (tolerance {tolerance:.0%}):")
+    for name, result in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous:
+            print(f"  {name:<34} (no baseline)")
+            continue
+        change = result['ns_per_op'] / previous['ns_per_op'] - 1
+        status = 'REGRESSION' if change > tolerance else 'ok'
+        if change > tolerance:
+            ok = False
+        print(f"  {name:<34} {change:>+8.1%}  {status}")
+    return ok
+
+def load_candidate(spec: str) -> Tuple[str, Callable]:
+    """Parse name=module:attr into a callable."""
+    name, _, target = spec.partition('=')
+    module_name, _, attr = target.partition(':')
+    if not name or not module_name or not attr:
+        raise argparse.ArgumentTypeError(f"expected name=module:attr, got {spec!r}")
+    obj = importlib.import_module(module_name)
+    for part in attr.split('.'):
+        obj = getattr(obj, part)
+    return name, obj
+
+def parity_checks(settings: Dict, candidates: List[Tuple[str, Callable]]) -> Dict[str, Tuple[Callable, Callable]]:
+    """Pairs of (reference, candidate) per-job callables that must agree exactly."""
+    job_filter = JobFilter(settings)
+    builtin_rules = RuleSet({})
+    references = {
+        'classify_role_by_title': lambda job: classify_role_by_title(job['title']),
+        'is_us_location': lambda job: is_us_location(job['location']),
+        'has_internship_keywords': lambda job: has_internship_keywords(job['title'], job['description']),
+        'analyze_experience_requirements': lambda job: _analyze_experience_requirements(job['title'], job['description']),
+        'JobFilter.determine_level': lambda job: job_filter._determine_level(job['title'], job['description']),
+        'is_relevant_job': lambda job: is_relevant_job(dict(job), settings)
+    }
+
+    # Optimized paths already in the tree
+    checks = {
+        'analyze_experience_requirements (memoized)': (
+            references['analyze_experience_requirements'],
+            lambda job: analyze_experience_requirements(job['title'], job['description'])
+        ),
+        'JobFilter.determine_level (memoized)': (
+            references['JobFilter.determine_level'],
+            lambda job: job_filter.determine_level(job['title'], job['description'])
+        ),
+        'classify_role_by_title (RuleSet, built-in only)': (
+            references['classify_role_by_title'],
+            lambda job: builtin_rules.classify_title(job['title'])
+        ),
+        'is_relevant_job (RuleSet, built-in only)': (
+            references['is_relevant_job'],
+            lambda job: is_relevant_job(dict(job), settings, builtin_rules)
+        )
+    }
+
+    for name, func in candidates:
+        if name not in references:
+            raise SystemExit(f"No reference implementation named {name!r}; choose from {', '.join(references)}")
+        if name in ('classify_role_by_title', 'is_us_location'):
+            arg = 'title' if name == 'classify_role_by_title' else 'location'
+            candidate = (lambda f, a: lambda job: f(job[a]))(func, arg)
+        elif name == 'is_relevant_job':
+            candidate = (lambda f: lambda job: f(dict(job), settings))(func)
+        else:
+            candidate = (lambda f: lambda job: f(job['title'], job['description']))(func)
+        checks[f"{name} (candidate)"] = (references[name], candidate)
+    return checks
+
+def superset_checks(settings: Dict) -> Dict[str, Tuple[Callable, Callable, Callable]]:
+    """(reference, candidate, is_foreign) triples for rules that may only add matches.
+    
+    The candidate must return the reference's result wherever the reference
+    accepts a job, and must reject every job is_foreign flags.
+    """
+    rules = JobFilter(settings).rules
+    return {
+        'classify_role_by_title (RuleSet, settings.yml)': (
+            lambda job: classify_role_by_title(job['title']),
+            lambda job: rules.classify_title(job['title']),
+            lambda job: any(title in job['title'] for title in NON_TECH_TITLES)
+        ),
+        'is_us_location (RuleSet, settings.yml)': (
+            lambda job: is_us_location(job['location']),
+            lambda job: rules.matches_location(job['location']),
+            lambda job: job['location'] in FOREIGN_LOCATIONS
+        )
+    }
+
+def with_probes(corpus: List[Dict]) -> List[Dict]:
+    """The corpus plus jobs whose title or location only the configured rules accept."""
+    template = corpus[0] if corpus else {'title': '', 'location': '', 'description': ''}
+    probes = [dict(template, location=location) for location in CONFIGURED_ONLY_LOCATIONS]
+    probes += [dict(template, title=title) for title in CONFIGURED_ONLY_TITLES]
+    return corpus + probes
+
+def run_superset(corpus: List[Dict], checks: Dict[str, Tuple[Callable, Callable, Callable]]) -> bool:
+    ok = True
+    for name, (reference, candidate, is_foreign) in checks.items():
+        failures = []
+        added = 0
+        for job in corpus:
+            expected = reference(job)
+            actual = candidate(job)
+            if expected:
+                if actual != expected:
+                    failures.append((job, expected, actual))
+            elif actual:
+                if is_foreign(job):
+                    failures.append((job, expected, actual))
+                else:
+                    added += 1
+        status = f"ok ({added} added)" if not failures else f"{len(failures)} MISMATCHES"
+        print(f"  {name:<50} {status}")
+        for job, expected, actual in failures[:3]:
+            print(f"      title={job['title']!r} location={job['location']!r}: expected {expected!r}, got {actual!r}")
+        ok = ok and not failures
+    return ok
+
+def run_parity(corpus: List[Dict], checks: Dict[str, Tuple[Callable, Callable]]) -> bool:
+    ok = True
+    for name, (reference, candidate) in checks.items():
+        analysis_cache.clear()
+        mismatches = []
+        for job in corpus:
+            expected = reference(job)
+            actual = candidate(job)
+            if expected != actual:
+                mismatches.append((job, expected, actual))
+        status = 'ok' if not mismatches else f"{len(mismatches)} MISMATCHES"
+        print(f"  {name:<50} {status}")
+        for job, expected, actual in mismatches[:3]:
+            print(f"      title={job['title']!r} location={job['location']!r}: expected {expected!r}, got {actual!r}")
+        ok = ok and not mismatches
+    return ok
+
+def run_batch_parity(corpus: List[Dict], settings: Dict) -> bool:
+    """Check the column-oriented filter/sort/dedup path against the row-by-row one."""
+    job_filter = JobFilter(settings)
+    expected = finalize_jobs(job_filter.filter_jobs([dict(job) for job in corpus]))
+    batch = finalize_jobs(job_filter.filter_jobs(JobBatch.from_records(corpus)))
+    actual = batch.to_records()
+    ok = expected == actual
+    status = 'ok' if ok else f"MISMATCH ({len(expected)} row jobs vs {len(actual)} batch jobs)"
+    print(f"  {'JobFilter.filter_jobs + finalize_jobs (JobBatch)':<50} {status}")
+    
+    # write_outputs must produce the same bytes either way, so --batch never churns jobs.json
+    same_bytes = batch.to_json_bytes() == json_backend.dumps(expected, indent=True)
+    print(f"  {'jobs.json bytes (JobBatch)':<50} {'ok' if same_bytes else 'MISMATCH'}")
+    return ok and same_bytes
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the job classifiers in utils.py.")
+    parser.add_argument('--jobs', type=int, default=10000, help="synthetic corpus size (default: 10000)")
+    parser.add_argument('--seed', type=int, default=42, help="corpus random seed (default: 42)")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions; the best is reported (default: 3)")
+    parser.add_argument('--shapes', default='data/jobs.json', help="jobs file whose titles/locations shape the corpus")
+    parser.add_argument('--settings', default='settings.yml')
+    parser.add_argument('--baseline', help="compare against this baseline file and exit 1 on regression")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="allowed slowdown vs baseline (default: 0.15)")
+    parser.add_argument('--save-baseline', metavar='PATH', help="write the results as a new baseline")
+    parser.add_argument('--parity', action='store_true', help="check optimized implementations against the reference ones")
+    parser.add_argument('--candidate', action='append', default=[], type=load_candidate, metavar='NAME=MODULE:ATTR',
+                        help="extra implementation to parity-check against the reference NAME (repeatable)")
+    args = parser.parse_args()
+
+    settings = load_yaml(args.settings)
+    print(f"Generating {args.jobs} synthetic jobs (seed {args.seed})...")
+    corpus = generate_corpus(args.jobs, args.seed, args.shapes)
+
+    ok = True
+    if args.parity or args.candidate:
+        print("\nParity:")
+        ok = run_parity(corpus, parity_checks(settings, args.candidate))
+        ok = run_superset(with_probes(corpus), superset_checks(settings)) and ok
+        ok = run_batch_parity(corpus, settings) and ok
+    else:
+        print("\nBenchmarks:")
+        results = run_benchmarks(corpus, build_benchmarks(settings), args.repeat)
+
+        if args.save_baseline:
+            with open(args.save_baseline, 'w') as f:
+                json.dump({
+                    'jobs': args.jobs,
+                    'seed': args.seed,
+                    'python': platform.python_version(),
+                    'created_at': datetime.now(timezone.utc).isoformat(),
+                    'results': results
+                }, f, indent=2)
+            print(f"\nSaved baseline to {args.save_baseline}")
+
+        if args.baseline:
+            ok = compare_to_baseline(results, args.baseline, args.tolerance)
+
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
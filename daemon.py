@@ -0,0 +1,163 @@
+import time
+import signal
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple
+from discovery import CompanyDiscovery
+from filters import JobFilter
+from analysis_cache import AnalysisCache
+from providers.base import BaseProvider
+from pipeline import merge_discovered, scrape_board, finalize_jobs, write_outputs, LastGoodStore
+
+class Board:
+    """One provider/company pair and its refresh schedule."""
+
+    def __init__(self, provider_name: str, company: str, interval: float):
+        self.provider_name = provider_name
+        self.company = company
+        self.interval = interval
+        self.next_run = 0.0
+        self.jobs: List[Dict] = []
+        self.content_hash = None
+        self.attempted = False
+
+class Daemon:
+    """Keeps sessions, caches and compiled rules warm and refreshes each board on its own interval.
+
+    A board that changed since its last fetch is refreshed twice as often (down
+    to min_interval_minutes); an unchanged board backs off (up to
+    max_interval_minutes). A board whose fetch fails keeps serving its last good
+    jobs, within output.max_stale_hours, and is retried at min_interval_minutes.
+    Output files are rewritten after every batch that changed something.
+    """
+
+    def __init__(self, settings: Dict, companies: Dict[str, List[str]], providers: Dict[str, BaseProvider],
+                 discovery: CompanyDiscovery, job_filter: JobFilter, analysis_cache: AnalysisCache,
+                 last_good: LastGoodStore):
+        self.companies = companies
+        self.providers = {name: provider for name, provider in providers.items() if provider.is_enabled()}
+        self.discovery = discovery
+        self.job_filter = job_filter
+        self.analysis_cache = analysis_cache
+        self.last_good = last_good
+
+        daemon_settings = settings.get('daemon', {})
+        self.min_interval = daemon_settings.get('min_interval_minutes', 5) * 60
+        self.max_interval = daemon_settings.get('max_interval_minutes', 120) * 60
+        self.initial_interval = daemon_settings.get('initial_interval_minutes', 30) * 60
+        self.batch_size = daemon_settings.get('batch_size', 20)
+        self.max_workers = daemon_settings.get('max_workers', 8)
+        self.discovery_interval = daemon_settings.get('discovery_interval_hours', 24) * 3600
+        self.data_dir = daemon_settings.get('data_dir', 'data')
+
+        self.boards: Dict[Tuple[str, str], Board] = {}
+        self.next_discovery = 0.0
+        self._stop = threading.Event()
+
+    def serve(self):
+        """Run until SIGINT/SIGTERM."""
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        print(f"Serving {len(self.providers)} providers (min interval {self.min_interval // 60:.0f}m, max {self.max_interval // 60:.0f}m)")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not self._stop.is_set():
+                if time.time() >= self.next_discovery:
+                    self._refresh_boards()
+
+                due = self._due_boards()
+                if due:
+                    self._run_batch(executor, due)
+                    continue
+
+                self._stop.wait(self._seconds_until_next())
+
+        self.analysis_cache.save()
+        print("Daemon stopped")
+
+    def stop(self):
+        self._stop.set()
+
+    def _handle_signal(self, signum, frame):
+        print(f"Received signal {signum}, finishing current batch...")
+        self.stop()
+
+    def _refresh_boards(self):
+        """Rediscover companies and add/remove boards to match."""
+        print("Discovering companies from GitHub lists...")
+        companies = merge_discovered(self.companies, self.discovery.discover_companies())
+        self.next_discovery = time.time() + self.discovery_interval
+
+        wanted = set()
+        for provider_name in self.providers:
+            for company in companies.get(provider_name, []):
+                wanted.add((provider_name, company))
+                if (provider_name, company) not in self.boards:
+                    self.boards[(provider_name, company)] = Board(provider_name, company, self.initial_interval)
+
+        for key in list(self.boards):
+            if key not in wanted:
+                del self.boards[key]
+        self.last_good.prune(wanted)
+        print(f"Tracking {len(self.boards)} boards")
+
+    def _due_boards(self) -> List[Board]:
+        now = time.time()
+        due = sorted((board for board in self.boards.values() if board.next_run <= now), key=lambda board: board.next_run)
+        return due[:self.batch_size]
+
+    def _seconds_until_next(self) -> float:
+        next_runs = [board.next_run for board in self.boards.values()] + [self.next_discovery]
+        return max(1.0, min(next_runs) - time.time())
+
+    def _run_batch(self, executor: ThreadPoolExecutor, boards: List[Board]):
+        results = list(executor.map(self._update_board, boards))
+        changed = sum(results)
+        print(f"Refreshed {len(boards)} boards, {changed} changed")
+        if changed:
+            self._write()
+
+    def _update_board(self, board: Board) -> bool:
+        """Fetch one board and reschedule it. Returns True if its jobs changed."""
+        stats = {'fetched': 0, 'internships': 0, 'non_us': 0}
+        jobs = scrape_board(self.providers[board.provider_name], board.company, self.job_filter, stats)
+        board.attempted = True
+        
+        if jobs is None:
+            # Serve the last good jobs (from this process or a previous run) until they go stale
+            recovered = self.last_good.recover(board.provider_name, board.company)
+            changed = recovered != board.jobs
+            board.jobs = recovered
+            board.next_run = time.time() + self.min_interval
+            return changed
+        self.last_good.record_success(board.provider_name, board.company, jobs)
+
+        # Only stable fields count: LinkedIn and JobRight stamp posted_date with the fetch time
+        fingerprint = hashlib.sha256(
+            repr(sorted((job['url'], job['title']) for job in jobs)).encode('utf-8')
+        ).hexdigest()
+        changed = fingerprint != board.content_hash
+
+        # The first fetch only establishes a baseline
+        if board.content_hash is not None:
+            if changed:
+                board.interval = max(self.min_interval, board.interval / 2)
+            else:
+                board.interval = min(self.max_interval, board.interval * 2)
+        board.jobs = jobs
+        board.content_hash = fingerprint
+        board.next_run = time.time() + board.interval
+        return changed
+
+    def _write(self):
+        # Wait until every board has been tried once so a partial first pass never replaces the output
+        pending = sum(1 for board in self.boards.values() if not board.attempted)
+        if pending:
+            print(f"Waiting for {pending} boards before writing output")
+            return
+        all_jobs = [job for board in self.boards.values() for job in board.jobs]
+        jobs = finalize_jobs(all_jobs)
+        write_outputs(jobs, self.data_dir)
+        self.last_good.save()
+        self.analysis_cache.save()
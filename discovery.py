@@ -1,35 +1,99 @@
-import requests
-from typing import List, Dict
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from utils import extract_domains_from_text, normalize_company_name
+from fileio import load_json_file, save_json_file
+from http_client import get_client
 
 class CompanyDiscovery:
     def __init__(self, settings: Dict):
         self.settings = settings
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; job-scraper/1.0)'})
-    
+        self.http = get_client()
+        discovery_settings = settings.get('discovery', {})
+        self.cache_file = discovery_settings.get('cache_file', '.cache/discovery.json')
+        self.cache_ttl = discovery_settings.get('cache_ttl_hours', 24) * 3600
+        self.max_workers = discovery_settings.get('max_workers', 4)
+        self.timeout = discovery_settings.get('timeout', 10)
+
     def discover_companies(self) -> Dict[str, List[str]]:
         """Discover companies from GitHub lists and return organized by provider."""
         if not self.settings['discovery']['enabled']:
             return {'greenhouse': [], 'lever': [], 'ashby': []}
-        
-        all_companies = []
-        
-        for url in self.settings['discovery']['github_lists']:
-            try:
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    companies = extract_domains_from_text(response.text)
-                    all_companies.extend(companies)
-                    print(f"Discovered {len(companies)} companies from {url}")
-            except Exception as e:
-                print(f"Failed to fetch {url}: {e}")
-        
+
+        urls = self.settings['discovery']['github_lists']
+        cache = self._load_cache()
+
+        # Fetch all lists concurrently; each result is a cache entry for its URL
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(urls) or 1))) as executor:
+            entries = list(executor.map(lambda url: self._fetch_list(url, cache.get(url)), urls))
+
+        all_companies = set()
+        for url, entry in zip(urls, entries):
+            if entry is not None:
+                cache[url] = entry
+                all_companies.update(entry['companies'])
+
+        self._save_cache({url: cache[url] for url in urls if url in cache})
+
+        # Sorted so the provider split (and therefore each shard) is stable between runs
+        all_companies = sorted(all_companies)
+
         # Organize companies by provider (simple heuristic)
         discovered = {
             'greenhouse': all_companies[:len(all_companies)//3],
             'lever': all_companies[len(all_companies)//3:2*len(all_companies)//3],
             'ashby': [c.title().replace('-', ' ') for c in all_companies[2*len(all_companies)//3:]]
         }
-        
-        return discovered
\ No newline at end of file
+
+        return discovered
+
+    def _fetch_list(self, url: str, cached: Optional[Dict]) -> Optional[Dict]:
+        """Fetch one list, reusing the cached extraction when it is fresh or unchanged."""
+        now = time.time()
+        if cached and now - cached.get('fetched_at', 0) < self.cache_ttl:
+            print(f"Discovered {len(cached['companies'])} companies from {url} (cached)")
+            return cached
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response = self.http.get(url, headers=headers, timeout=self.timeout)
+        except Exception as e:
+            print(f"Failed to fetch {url}: {e}")
+            return cached
+
+        if response.status_code == 304 and cached:
+            print(f"Discovered {len(cached['companies'])} companies from {url} (not modified)")
+            return dict(cached, fetched_at=now)
+
+        if response.status_code != 200:
+            return cached
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if cached and cached.get('content_hash') == content_hash:
+            companies = cached['companies']
+        else:
+            companies = extract_domains_from_text(response.text)
+        print(f"Discovered {len(companies)} companies from {url}")
+
+        return {
+            'companies': companies,
+            'content_hash': content_hash,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': now
+        }
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load the on-disk discovery cache, ignoring a missing or corrupt file."""
+        return load_json_file(self.cache_file, 'discovery cache', {})
+
+    def _save_cache(self, cache: Dict[str, Dict]):
+        """Persist the discovery cache."""
+        save_json_file(self.cache_file, cache, 'discovery cache')
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from typing import Any
+import json_backend
+
+def atomic_write(filepath: str, data: bytes):
+    """Write bytes to a temp file next to filepath, then rename it into place."""
+    directory = os.path.dirname(filepath) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(filepath)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_json_file(filepath: str, description: str, default: Any) -> Any:
+    """Load a JSON cache file, returning default if it is missing or unreadable."""
+    if not filepath or not os.path.exists(filepath):
+        return default
+    try:
+        with open(filepath, 'rb') as f:
+            return json_backend.loads(f.read())
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable {description} {filepath}: {e}")
+        return default
+
+def save_json_file(filepath: str, data: Any, description: str):
+    """Atomically write a JSON cache file; a failed write is logged, never raised."""
+    if not filepath:
+        return
+    try:
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        atomic_write(filepath, json_backend.dumps(data))
+    except OSError as e:
+        print(f"Failed to write {description} {filepath}: {e}")
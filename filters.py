@@ -1,16 +1,24 @@
-from typing import List, Dict
-from utils import is_relevant_job
+import pandas as pd
+from typing import List, Dict, Union
+from utils import is_relevant_job, classify_relevant_role
+from batch import JobBatch
+from analysis_cache import analysis_cache
+from rules import RuleSet
 
 class JobFilter:
     def __init__(self, settings: Dict):
         self.settings = settings
+        self.rules = RuleSet.from_settings(settings)
     
     def categorize_role(self, title: str) -> str:
-        """Categorize job role based on title - use stored classification."""
-        # This will be set by the filtering process
-        return 'SWE'  # Default fallback
+        """Categorize job role based on title using the compiled rules."""
+        return self.rules.classify_title(title) or 'SWE'  # Default fallback
     
     def determine_level(self, title: str, description: str) -> str:
+        """Determine experience level based on title and description (memoized)."""
+        return analysis_cache.get_or_compute('level', title, description, self._determine_level)
+    
+    def _determine_level(self, title: str, description: str) -> str:
         """Determine experience level based on title and description."""
         import re
         title_lower = title.lower()
@@ -36,12 +44,18 @@ class JobFilter:
         # Default for entry-level jobs
         return 'Entry Level'
     
-    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter jobs based on location, title, and experience level."""
+    def filter_jobs(self, jobs: Union[List[Dict], JobBatch]) -> Union[List[Dict], JobBatch]:
+        """Filter jobs based on location, title, and experience level.
+        
+        A JobBatch is filtered column-wise and returns a JobBatch.
+        """
+        if isinstance(jobs, JobBatch):
+            return self._filter_batch(jobs)
+        
         filtered = []
         
         for job in jobs:
-            if is_relevant_job(job, self.settings):
+            if is_relevant_job(job, self.settings, self.rules):
                 # Standardize job data
                 standardized = {
                     'title': job.get('title', ''),
@@ -51,9 +65,32 @@ class JobFilter:
                     'posted_date': job.get('posted_date', ''),
                     'provider': job.get('provider', ''),
                     'description': job.get('description', '')[:500] + '...' if len(job.get('description', '')) > 500 else job.get('description', ''),
-                    'role_category': self.categorize_role(job.get('title', '')),
+                    'role_category': job.get('_role_category') or self.categorize_role(job.get('title', '')),
                     'level': self.determine_level(job.get('title', ''), job.get('description', ''))
                 }
                 filtered.append(standardized)
         
-        return filtered
\ No newline at end of file
+        return filtered
+    
+    def _filter_batch(self, batch: JobBatch) -> JobBatch:
+        """Vectorized date/internship/location checks, then row-wise regexes on the survivors only."""
+        mask = batch.recent_mask() & ~batch.internship_mask() & batch.location_mask(self.rules)
+        survivors = batch.take(mask)
+        
+        titles = survivors.frame['title'].tolist()
+        descriptions = survivors.frame['description'].tolist()
+        categories = [classify_relevant_role(title, description, self.rules) for title, description in zip(titles, descriptions)]
+        keep = [category is not None for category in categories]
+        
+        result = survivors.take(keep)
+        frame = result.frame
+        titles = [title for title, kept in zip(titles, keep) if kept]
+        descriptions = [description for description, kept in zip(descriptions, keep) if kept]
+        
+        # Standardize job data
+        long_description = frame['description'].str.len() > 500
+        frame.loc[long_description, 'description'] = frame.loc[long_description, 'description'].str.slice(0, 500) + '...'
+        frame['role_category'] = pd.array([category for category in categories if category is not None], dtype=frame['title'].dtype)
+        frame['level'] = pd.array([self.determine_level(title, description) for title, description in zip(titles, descriptions)],
+                                  dtype=frame['title'].dtype)
+        return result
@@ -0,0 +1,120 @@
+import threading
+import requests
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+class HttpClient:
+    """Hands out one keep-alive session per host, shared by every caller."""
+
+    def __init__(self, settings: Optional[Dict] = None):
+        settings = settings or {}
+        self.pool_maxsize = settings.get('pool_maxsize', 16)
+        self.max_concurrency_per_host = settings.get('max_concurrency_per_host', 4)
+        self.host_settings = settings.get('hosts', {}) or {}
+        # requests already sends Accept-Encoding (with br when a brotli decoder is installed)
+        self.headers = {
+            'User-Agent': settings.get('user_agent', 'Mozilla/5.0 (compatible; job-scraper/1.0)')
+        }
+        self._sessions: Dict[str, requests.Session] = {}
+        self._failed_statuses: Dict[str, Counter] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the shared session for the URL's host, creating it on first use."""
+        host = urlparse(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._build_session(host)
+                self._sessions[host] = session
+            return session
+
+    def host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore that limits concurrent requests to the URL's host."""
+        host = urlparse(url).netloc
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._host_setting(host, 'max_concurrency', self.max_concurrency_per_host))
+                self._slots[host] = slot
+            return slot
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        response = self.session_for(url).get(url, **kwargs)
+        if response.status_code != 200:
+            host = urlparse(url).netloc
+            with self._lock:
+                self._failed_statuses.setdefault(host, Counter())[response.status_code] += 1
+        return response
+
+    def _build_session(self, host: str) -> requests.Session:
+        maxsize = self._host_setting(host, 'pool_maxsize', self.pool_maxsize)
+        # Room for a few extra hosts so redirects (http->https, careers-page guesses)
+        # don't evict the keyed host's pool and its keep-alive connections
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=maxsize)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(self.headers)
+        return session
+
+    def _host_setting(self, host: str, key: str, default: int) -> int:
+        return (self.host_settings.get(host) or {}).get(key, default)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Requests, new connections, reused connections and non-200 responses per host."""
+        with self._lock:
+            sessions = dict(self._sessions)
+            failed_statuses = {host: dict(statuses) for host, statuses in self._failed_statuses.items()}
+
+        stats = {}
+        for host, session in sorted(sessions.items()):
+            requests_made = 0
+            connections = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_made += pool.num_requests
+                    connections += pool.num_connections
+            stats[host] = {
+                'requests': requests_made,
+                'connections': connections,
+                'reused': max(requests_made - connections, 0),
+                'non_200': failed_statuses.get(host, {})
+            }
+        return stats
+
+    def print_stats(self):
+        stats = self.stats()
+        total_requests = sum(s['requests'] for s in stats.values())
+        total_connections = sum(s['connections'] for s in stats.values())
+        print(f"HTTP: {total_requests} requests over {total_connections} connections across {len(stats)} hosts")
+        for host, s in stats.items():
+            line = f"  {host}: {s['requests']} requests, {s['connections']} connections, {s['reused']} reused"
+            if s['non_200']:
+                line += ", non-200: " + ', '.join(f"{status} x{count}" for status, count in sorted(s['non_200'].items()))
+            print(line)
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+def configure_client(settings: Optional[Dict] = None) -> HttpClient:
+    """Replace the shared client with one built from the 'http' settings section."""
+    global _client
+    with _client_lock:
+        _client = HttpClient(settings)
+        return _client
+
+def get_client() -> HttpClient:
+    """Return the shared client, creating one with default settings if needed."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
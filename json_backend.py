@@ -0,0 +1,76 @@
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# Optional fast backends; msgspec is preferred because it can skip unwanted fields while decoding
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if msgspec is not None:
+    BACKEND = 'msgspec'
+elif orjson is not None:
+    BACKEND = 'orjson'
+else:
+    BACKEND = 'json'
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON straight from response bytes (or str)."""
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if msgspec is not None:
+        encoded = msgspec.json.encode(obj)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+@lru_cache(maxsize=None)
+def _record_decoder(fields: tuple, key: Optional[str]):
+    """Build a msgspec decoder that materializes only the given record fields."""
+    record = msgspec.defstruct(
+        'Record',
+        [(field, Any, msgspec.UNSET) for field in fields],
+        forbid_unknown_fields=False
+    )
+    if key is None:
+        return msgspec.json.Decoder(List[record])
+    board = msgspec.defstruct('Board', [(key, List[record], [])], forbid_unknown_fields=False)
+    return msgspec.json.Decoder(board)
+
+def load_records(data: Union[bytes, str], fields: Sequence[str], key: Optional[str] = None) -> List[Dict]:
+    """Decode a JSON list of records (or the list under key) keeping only fields.
+
+    Fields missing from a record are left out of its dict, so callers keep
+    using .get() with their usual defaults.
+    """
+    fields = tuple(fields)
+
+    if msgspec is not None:
+        decoded = _record_decoder(fields, key).decode(data)
+        records = getattr(decoded, key) if key is not None else decoded
+        result = []
+        for record in records:
+            values = {}
+            for field in fields:
+                value = getattr(record, field)
+                if value is not msgspec.UNSET:
+                    values[field] = value
+            result.append(values)
+        return result
+
+    decoded = loads(data)
+    records = decoded.get(key, []) if key is not None else decoded
+    return [{field: record[field] for field in fields if field in record} for record in records]
@@ -0,0 +1,196 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from typing import List, Dict, Tuple, Optional, Iterable, Union
+from profiling import profiler
+from utils import save_json, has_internship_keywords
+from fileio import atomic_write, load_json_file, save_json_file
+from filters import JobFilter
+from batch import JobBatch, FILTERED_COLUMNS
+from providers.base import BaseProvider
+from providers.greenhouse import GreenhouseProvider
+from providers.lever import LeverProvider
+from providers.ashby import AshbyProvider
+from providers.linkedin import LinkedInProvider
+from providers.jobright import JobRightProvider
+from providers.experimental_jobright_like import ExperimentalJobrightLikeProvider
+
+def build_providers(settings: Dict) -> Dict[str, BaseProvider]:
+    """Initialize providers from settings."""
+    return {
+        'greenhouse': GreenhouseProvider(settings['providers']['greenhouse']),
+        'lever': LeverProvider(settings['providers']['lever']),
+        'ashby': AshbyProvider(settings['providers']['ashby']),
+        'linkedin': LinkedInProvider(settings['providers']['linkedin']),
+        'jobright': JobRightProvider(settings['providers']['jobright']),
+        'experimental_jobright_like': ExperimentalJobrightLikeProvider(settings['providers']['experimental_jobright_like'])
+    }
+
+def merge_discovered(companies: Dict[str, List[str]], discovered: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Merge discovered companies into the guaranteed list."""
+    merged = {provider: list(company_list) for provider, company_list in companies.items()}
+    for provider, company_list in discovered.items():
+        if provider in merged:
+            merged[provider].extend(company_list)
+            merged[provider] = list(dict.fromkeys(merged[provider]))  # Remove duplicates, keep order
+    return merged
+
+def scrape_board(provider: BaseProvider, company: str, job_filter: JobFilter, stats: Dict[str, int],
+                 use_batches: bool = False) -> Optional[Union[List[Dict], JobBatch]]:
+    """Fetch one company's board, filtering each page as soon as it arrives.
+    
+    With use_batches each page is converted to a JobBatch and filtered column-wise,
+    and a JobBatch is returned. Returns None if the fetch failed, so the board's
+    last good jobs can be used instead.
+    """
+    company_jobs = 0
+    filtered_jobs = []
+    filtered_batches = []
+    # Profiling only sees the calling thread, so skip background prefetch when it is on
+    pages = provider.iter_job_pages(company) if profiler.enabled else provider.stream_job_pages(company)
+    try:
+        for page in pages:
+            company_jobs += len(page)
+            
+            if use_batches:
+                page_batch = JobBatch.from_records(page)
+                internships = page_batch.internship_mask()
+                stats['internships'] += int(internships.sum())
+                stats['non_us'] += int((~internships & ~page_batch.location_mask(job_filter.rules)).sum())
+                with profiler.stage('filter'):
+                    filtered_batches.append(job_filter.filter_jobs(page_batch))
+                continue
+            
+            # Pre-filter to track rejections
+            for job in page:
+                title = job.get('title', '')
+                location = job.get('location', '')
+                description = job.get('description', '')
+                
+                if has_internship_keywords(title, description):
+                    stats['internships'] += 1
+                elif not job_filter.rules.matches_location(location):
+                    stats['non_us'] += 1
+            
+            with profiler.stage('filter'):
+                filtered_jobs.extend(job_filter.filter_jobs(page))
+        
+        if company_jobs:
+            print(f"  OK {company}: {company_jobs} jobs")
+        else:
+            print(f"  FAIL {company}: no jobs found")
+    except Exception as e:
+        print(f"  ERROR {company}: error - {e}")
+        return None
+    finally:
+        stats['fetched'] += company_jobs
+    if use_batches:
+        return JobBatch.concat(filtered_batches, FILTERED_COLUMNS)
+    return filtered_jobs
+
+class LastGoodStore:
+    """Filtered jobs from each board's last successful fetch, persisted between runs."""
+    
+    def __init__(self, settings: Dict):
+        self.path = settings.get('last_good_file', '.cache/last_good.json')
+        self.max_stale = settings.get('max_stale_hours', 24) * 3600
+        self.boards: Dict[str, Dict] = {}
+    
+    @staticmethod
+    def board_key(provider_name: str, company: str) -> str:
+        return f"{provider_name}/{company}"
+    
+    def load(self):
+        """Load the store, ignoring a missing or corrupt file."""
+        self.boards = load_json_file(self.path, 'last-good store', {})
+    
+    def save(self):
+        """Persist the store; a failed write is logged so it never blocks the outputs."""
+        save_json_file(self.path, self.boards, 'last-good store')
+    
+    def record_success(self, provider_name: str, company: str, jobs: List[Dict]):
+        self.boards[self.board_key(provider_name, company)] = {'fetched_at': time.time(), 'jobs': jobs}
+    
+    def recover(self, provider_name: str, company: str) -> List[Dict]:
+        """Return the board's last good jobs if they are within the staleness limit."""
+        entry = self.boards.get(self.board_key(provider_name, company))
+        if not entry or time.time() - entry['fetched_at'] > self.max_stale:
+            return []
+        return entry['jobs']
+    
+    def prune(self, active: Iterable[Tuple[str, str]]):
+        """Drop boards that are no longer scraped."""
+        keep = {self.board_key(provider_name, company) for provider_name, company in active}
+        self.boards = {key: entry for key, entry in self.boards.items() if key in keep}
+
+def sort_key(job: Dict) -> Tuple[datetime, str]:
+    """Sort key for posted_date, then company."""
+    return (posted_datetime(job.get('posted_date', '')), job.get('company', ''))
+
+def posted_datetime(posted_date) -> datetime:
+    """Parse posted_date into an aware datetime; unparseable dates sort last."""
+    try:
+        if posted_date:
+            # Handle different date formats and ensure timezone awareness
+            if 'Z' in posted_date:
+                return datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
+            elif '+' in posted_date or '-' in posted_date[-6:]:
+                return datetime.fromisoformat(posted_date)
+            else:
+                # Assume UTC if no timezone info
+                return datetime.fromisoformat(posted_date).replace(tzinfo=timezone.utc)
+    except:
+        pass
+    return datetime.min.replace(tzinfo=timezone.utc)
+
+def finalize_jobs(jobs: Union[List[Dict], JobBatch]) -> Union[List[Dict], JobBatch]:
+    """Sort by posted_date DESC, then company, and deduplicate."""
+    if isinstance(jobs, JobBatch):
+        return _finalize_batch(jobs)
+    
+    jobs = sorted(jobs, key=sort_key, reverse=True)
+    
+    # Deduplicate by company + title + url
+    seen = set()
+    deduped_jobs = []
+    for job in jobs:
+        key = (job.get('company', ''), job.get('title', ''), job.get('url', ''))
+        if key not in seen:
+            seen.add(key)
+            deduped_jobs.append(job)
+    return deduped_jobs
+
+def _finalize_batch(batch: JobBatch) -> JobBatch:
+    """finalize_jobs for a JobBatch: a stable sort on parsed dates, then drop_duplicates."""
+    frame = batch.frame
+    codes, uniques = pd.factorize(frame['posted_date'], use_na_sentinel=False)
+    posted = np.array([posted_datetime(value).timestamp() for value in uniques], dtype=float)[codes]
+    order = frame.assign(_posted=posted).sort_values(['_posted', 'company'], ascending=False, kind='stable').index
+    frame = frame.loc[order].drop_duplicates(subset=['company', 'title', 'url'], keep='first')
+    return JobBatch(frame.reset_index(drop=True))
+
+def write_outputs(jobs: Union[List[Dict], JobBatch], data_dir: str = 'data'):
+    """Atomically rewrite jobs.json and jobs.csv."""
+    # Ensure data directory exists
+    os.makedirs(data_dir, exist_ok=True)
+    
+    json_path = os.path.join(data_dir, 'jobs.json')
+    csv_path = os.path.join(data_dir, 'jobs.csv')
+    if isinstance(jobs, JobBatch):
+        # Serialize straight from the columns
+        atomic_write(json_path, jobs.to_json_bytes())
+    else:
+        save_json(jobs, json_path)
+    
+    # Save as CSV
+    if isinstance(jobs, JobBatch) and len(jobs):
+        atomic_write(csv_path, jobs.to_csv_bytes())
+        print(f"Saved {len(jobs)} jobs to {json_path} and {csv_path}")
+    elif jobs:
+        df = pd.DataFrame(jobs)
+        atomic_write(csv_path, df.to_csv(index=False).encode('utf-8'))
+        print(f"Saved {len(jobs)} jobs to {json_path} and {csv_path}")
+    else:
+        print("No jobs to save")
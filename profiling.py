@@ -0,0 +1,168 @@
+import io
+import os
+import re
+import time
+import pstats
+import cProfile
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+# Functions called out in the summary because they dominate filtering cost
+WATCHED_FUNCTIONS = [
+    'classify_role_by_title',
+    'analyze_experience_requirements',
+    '_analyze_experience_requirements',
+    'is_us_location',
+    'has_internship_keywords',
+    'is_relevant_job',
+    'determine_level',
+    'load_records'
+]
+
+class StageProfiler:
+    """Opt-in cProfile + tracemalloc capture for named pipeline stages.
+
+    Stages may nest (filtering runs inside each provider's fetch); the outer
+    stage is paused while the inner one runs, so each function's time is
+    charged to the innermost stage only. Allocation snapshots are taken around
+    top-level stages only, so a nested stage's allocations count toward its
+    outer stage, and the profiler's own bookkeeping is kept out of every
+    stage's wall time. Work done on other threads is not captured, so
+    profiled runs fetch pages on the calling thread.
+    """
+
+    def __init__(self):
+        self.output_dir: Optional[str] = None
+        self.top = 25
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._wall: Dict[str, float] = defaultdict(float)
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._allocations: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+        self._stack: List[str] = []
+        self._excluded: List[float] = []  # profiler time to subtract from each open stage
+
+    @property
+    def enabled(self) -> bool:
+        return self.output_dir is not None
+
+    def start(self, output_dir: str, top: int = 25):
+        """Enable profiling; results are written to output_dir by write()."""
+        self.output_dir = output_dir
+        self.top = top
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name: str):
+        """Context manager that profiles the enclosed block as stage name (no-op when disabled)."""
+        if not self.enabled:
+            return nullcontext()
+        return self._profile_stage(name)
+
+    @contextmanager
+    def _profile_stage(self, name: str):
+        entered = time.perf_counter()
+        outer = self._stack[-1] if self._stack else None
+        if outer:
+            self._profiles[outer].disable()
+        profile = self._profiles.setdefault(name, cProfile.Profile())
+        self._stack.append(name)
+        self._excluded.append(0.0)
+
+        # Snapshots cost far more than a short stage, so nested stages skip them
+        before = tracemalloc.take_snapshot() if outer is None else None
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            stopped = time.perf_counter()
+            excluded = self._excluded.pop()
+            self._wall[name] += stopped - started - excluded
+            self._calls[name] += 1
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                self._record_allocations(name, after.compare_to(before, 'lineno'))
+
+            self._stack.pop()
+            if outer:
+                # Charge none of this stage's profiler bookkeeping to the outer stage
+                self._excluded[-1] += excluded + (started - entered) + (time.perf_counter() - stopped)
+                self._profiles[outer].enable()
+
+    def _record_allocations(self, name: str, diffs):
+        totals = self._allocations[name]
+        for diff in diffs:
+            frame = diff.traceback[0]
+            if frame.filename == tracemalloc.__file__:
+                continue
+            location = f"{frame.filename}:{frame.lineno}"
+            totals[location][0] += diff.size_diff
+            totals[location][1] += diff.count_diff
+
+    def write(self):
+        """Write per-stage .prof and allocation files plus summary.txt."""
+        if not self.enabled:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        for name, profile in self._profiles.items():
+            profile.dump_stats(os.path.join(self.output_dir, f"{self._file_name(name)}.prof"))
+            if name not in self._allocations:
+                continue  # nested stage; its allocations are in the outer stage's file
+            with open(os.path.join(self.output_dir, f"{self._file_name(name)}.alloc.txt"), 'w') as f:
+                f.write(self._format_allocations(name))
+
+        with open(os.path.join(self.output_dir, 'summary.txt'), 'w') as f:
+            f.write(self.summary())
+        print(f"Wrote profile for {len(self._profiles)} stages to {self.output_dir}")
+
+    def summary(self) -> str:
+        out = io.StringIO()
+        out.write("Stage wall time (an outer stage includes its nested stages)\n")
+        for name in sorted(self._wall, key=self._wall.get, reverse=True):
+            out.write(f"  {name:<30} {self._wall[name]:>10.3f}s  {self._calls[name]:>6} calls\n")
+
+        stats = self._combined_stats()
+        if stats is None:
+            return out.getvalue()
+
+        out.write("\nWatched functions (all stages)\n")
+        for func, (cc, nc, tt, ct, callers) in sorted(stats.stats.items(), key=lambda item: -item[1][3]):
+            if func[2] in WATCHED_FUNCTIONS:
+                out.write(f"  {func[2]:<34} {nc:>9} calls  {tt:>9.3f}s self  {ct:>9.3f}s cumulative\n")
+
+        out.write(f"\nTop {self.top} functions by cumulative time (all stages)\n")
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(self.top)
+
+        out.write(f"\nTop {self.top} functions by self time (all stages)\n")
+        stats.sort_stats('tottime').print_stats(self.top)
+        return out.getvalue()
+
+    def _combined_stats(self) -> Optional[pstats.Stats]:
+        stats = None
+        for profile in self._profiles.values():
+            if not profile.getstats():
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        return stats
+
+    def _format_allocations(self, name: str) -> str:
+        totals = self._allocations[name]
+        lines = [f"Top {self.top} allocation sites for stage {name} (net bytes, net blocks)"]
+        for location, (size, count) in sorted(totals.items(), key=lambda item: -item[1][0])[:self.top]:
+            lines.append(f"  {size / 1024:>12.1f} KiB  {count:>8}  {location}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _file_name(name: str) -> str:
+        return re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+
+# Shared profiler; stays disabled unless run.py is given --profile
+profiler = StageProfiler()
@@ -1,5 +1,12 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from providers.base import BaseProvider
+from json_backend import load_records
+
+# The only job fields this provider reads (legacy names kept as fallbacks)
+JOB_FIELDS = (
+    'title', 'location', 'locationName', 'isRemote', 'isListed', 'jobUrl',
+    'publishedAt', 'publishedDate', 'descriptionPlain', 'description'
+)
 
 class AshbyProvider(BaseProvider):
     @property
@@ -9,34 +16,39 @@ class AshbyProvider(BaseProvider):
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch jobs from Ashby API."""
         try:
-            url = f"https://api.ashbyhq.com/job-board/company/{company}"
-            response = self.session.get(url, timeout=self.timeout)
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            jobs = []
-            
-            for job in data.get('jobs', []):
-                location_parts = []
-                if job.get('locationName'):
-                    location_parts.append(job['locationName'])
-                if job.get('isRemote'):
-                    location_parts.append('Remote')
-                
-                jobs.append({
-                    'title': job.get('title', ''),
-                    'company': company,
-                    'location': ', '.join(location_parts),
-                    'url': job.get('jobUrl', ''),
-                    'posted_date': job.get('publishedDate', ''),
-                    'provider': self.provider_name,
-                    'description': job.get('description', '')
-                })
-            
-            return jobs
-            
+            return self.collect_pages(company)
         except Exception as e:
             print(f"Error fetching {company} from Ashby: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield Ashby jobs from the public posting API, which returns the whole board at once."""
+        url = f"https://api.ashbyhq.com/posting-api/job-board/{company}"
+        response = self.fetch(url, params={'includeCompensation': 'false'})
+        
+        if not self.check_response(response, company):
+            return
+        
+        # Split the board into page_size chunks so filtering can start early
+        raw_jobs = [job for job in load_records(response.content, JOB_FIELDS, key='jobs') if job.get('isListed', True)]
+        for start in range(0, len(raw_jobs), self.page_size):
+            yield [self._map_job(job, company) for job in raw_jobs[start:start + self.page_size]]
+    
+    def _map_job(self, job: Dict, company: str) -> Dict:
+        location_parts = []
+        # posting-api uses 'location'; the legacy endpoint used 'locationName'
+        location_name = job.get('location') or job.get('locationName')
+        if location_name:
+            location_parts.append(location_name)
+        if job.get('isRemote'):
+            location_parts.append('Remote')
+        
+        return {
+            'title': job.get('title', ''),
+            'company': company,
+            'location': ', '.join(location_parts),
+            'url': job.get('jobUrl', ''),
+            'posted_date': job.get('publishedAt') or job.get('publishedDate', ''),
+            'provider': self.provider_name,
+            'description': job.get('descriptionPlain') or job.get('description', '')
+        }
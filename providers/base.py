@@ -1,25 +1,135 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Iterator, Iterable, Callable, Any, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 import requests
+from http_client import get_client
+
+class ProviderError(Exception):
+    """A board could not be fetched (as opposed to existing with no jobs)."""
+    pass
 
 class BaseProvider(ABC):
     def __init__(self, settings: Dict):
         self.settings = settings
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; job-scraper/1.0)'})
+        self.http = get_client()
         self.timeout = settings.get('timeout', 10)
-    
+        self.page_size = settings.get('page_size', 100)
+        self.max_pages = settings.get('max_pages', 50)
+
     @abstractmethod
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch jobs for a company. Must return list of job dicts."""
         pass
-    
+
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield jobs for a company one page at a time.
+
+        Providers backed by a paginated API override this; the default
+        yields everything from get_jobs as a single page.
+        """
+        jobs = self.get_jobs(company)
+        if jobs:
+            yield jobs
+
+    def stream_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield pages from iter_job_pages while the next page is fetched in the background."""
+        pages = queue.Queue(maxsize=1)
+        done = object()
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for page in self.iter_job_pages(company):
+                    if stop.is_set():
+                        return
+                    pages.put(page)
+            except Exception as e:
+                pages.put(e)
+            pages.put(done)
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            # Unblock the producer if it is waiting on a full queue
+            while worker.is_alive():
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def collect_pages(self, company: str) -> List[Dict]:
+        """Fetch every page for a company into a single list."""
+        jobs = []
+        for page in self.iter_job_pages(company):
+            jobs.extend(page)
+        return jobs
+
+    def fetch(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL while holding one of the host's concurrency slots (shared by every provider)."""
+        with self.http.host_slot(url):
+            return self.http.get(url, timeout=self.timeout, **kwargs)
+
+    def check_response(self, response: requests.Response, company: str) -> bool:
+        """Return True for a usable response, False if the board does not exist.
+
+        Any other status (rate limiting, server errors) raises ProviderError so
+        callers can tell a failed fetch from an empty board.
+        """
+        if response.status_code == 200:
+            return True
+        if response.status_code == 404:
+            return False
+        raise ProviderError(f"{self.provider_name} returned HTTP {response.status_code} for {company}")
+
+    def fan_out(self, func: Callable[[Any], List[Dict]], items: Iterable[Any]) -> List[List[Dict]]:
+        """Run func over items concurrently, returning results in item order."""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            return list(executor.map(func, items))
+
+    def fan_out_settled(self, func: Callable[[Any], List[Dict]], items: Iterable[Any]) -> Tuple[List[List[Dict]], List[Exception]]:
+        """Like fan_out, but a failing item yields no jobs and its exception is returned instead of raised."""
+        def settle(item):
+            try:
+                return func(item), None
+            except Exception as e:
+                return [], e
+
+        outcomes = self.fan_out(settle, items)
+        return [jobs for jobs, _ in outcomes], [error for _, error in outcomes if error is not None]
+
+    @staticmethod
+    def merge_unique(results: Iterable[List[Dict]], seen: Set[Any]) -> List[Dict]:
+        """Merge result lists, dropping jobs whose source id (or url and title) is already in seen."""
+        merged = []
+        for jobs in results:
+            for job in jobs:
+                key = job.get('_source_id') or (job.get('url'), job.get('title'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(job)
+        return merged
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
         """Return provider name."""
         pass
-    
+
     def is_enabled(self) -> bool:
         """Check if provider is enabled in settings."""
         return self.settings.get('enabled', True)
\ No newline at end of file
@@ -1,5 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from providers.base import BaseProvider
+from json_backend import load_records
+
+# The only job fields this provider reads
+JOB_FIELDS = ('title', 'location', 'absolute_url', 'updated_at', 'content')
 
 class GreenhouseProvider(BaseProvider):
     @property
@@ -9,28 +13,33 @@ class GreenhouseProvider(BaseProvider):
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch jobs from Greenhouse API."""
         try:
-            url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-            response = self.session.get(url, timeout=self.timeout)
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            jobs = []
-            
-            for job in data.get('jobs', []):
-                jobs.append({
-                    'title': job.get('title', ''),
-                    'company': company,
-                    'location': job.get('location', {}).get('name', ''),
-                    'url': job.get('absolute_url', ''),
-                    'posted_date': job.get('updated_at', ''),
-                    'provider': self.provider_name,
-                    'description': job.get('content', '')
-                })
-            
-            return jobs
-            
+            return self.collect_pages(company)
         except Exception as e:
             print(f"Error fetching {company} from Greenhouse: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield Greenhouse jobs; the board API returns the full board in one response."""
+        url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
+        params = {'content': 'true'} if self.settings.get('include_content', False) else {}
+        response = self.fetch(url, params=params)
+        
+        if not self.check_response(response, company):
+            return
+        
+        # Greenhouse has no pagination, so split the board into page_size chunks
+        # to let downstream filtering start before the whole board is mapped
+        raw_jobs = load_records(response.content, JOB_FIELDS, key='jobs')
+        for start in range(0, len(raw_jobs), self.page_size):
+            yield [self._map_job(job, company) for job in raw_jobs[start:start + self.page_size]]
+    
+    def _map_job(self, job: Dict, company: str) -> Dict:
+        return {
+            'title': job.get('title', ''),
+            'company': company,
+            'location': (job.get('location') or {}).get('name', ''),
+            'url': job.get('absolute_url', ''),
+            'posted_date': job.get('updated_at', ''),
+            'provider': self.provider_name,
+            'description': job.get('content', '')
+        }
@@ -1,6 +1,5 @@
-from typing import List, Dict
-import time
-from providers.base import BaseProvider
+from typing import List, Dict, Iterator, Optional
+from providers.base import BaseProvider, ProviderError
 
 class JobRightProvider(BaseProvider):
     @property
@@ -10,93 +9,100 @@ class JobRightProvider(BaseProvider):
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch entry-level jobs using JobRight-style aggregation."""
         try:
-            # JobRight aggregates from multiple sources - simulate this approach
-            job_sources = [
-                self._search_indeed(company),
-                self._search_glassdoor(company),
-                self._search_company_careers(company)
-            ]
-            
-            jobs = []
-            for source_jobs in job_sources:
-                jobs.extend(source_jobs)
-            
-            # Deduplicate and filter for entry-level
-            return self._filter_entry_level_jobs(jobs)
-            
+            return self.collect_pages(company)
         except Exception as e:
             print(f"Error fetching {company} from JobRight: {e}")
             return []
     
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield the merged entry-level results of every source as one page.
+        
+        Raises ProviderError when sources fail and none of the rest return
+        anything, since that can't be told apart from an outage.
+        """
+        # JobRight aggregates from multiple sources - simulate this approach
+        sources = [
+            self._search_indeed,
+            self._search_glassdoor,
+            self._search_company_careers
+        ]
+        job_sources, errors = self.fan_out_settled(lambda search: search(company), sources)
+        for error in errors:
+            print(f"  JobRight source failed for {company}: {error}")
+        if errors and not any(job_sources):
+            raise ProviderError(f"{len(errors)} of {len(sources)} JobRight sources failed for {company} and the rest found nothing")
+        
+        jobs = self.merge_unique(job_sources, set())
+        
+        # Deduplicate and filter for entry-level
+        jobs = self._filter_entry_level_jobs(jobs)
+        if jobs:
+            yield jobs
+    
     def _search_indeed(self, company: str) -> List[Dict]:
         """Search Indeed for entry-level positions."""
-        try:
-            url = "https://www.indeed.com/jobs"
-            params = {
-                'q': f'{company} "entry level" OR "new grad" OR "junior" software engineer',
-                'l': 'United States',
-                'fromage': '30',  # Last 30 days
-                'explvl': 'entry_level'
-            }
-            
-            time.sleep(1)  # Rate limiting
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                return self._parse_indeed_jobs(response.text, company)
-            
-        except Exception as e:
-            print(f"Indeed search failed for {company}: {e}")
+        url = "https://www.indeed.com/jobs"
+        params = {
+            'q': f'{company} "entry level" OR "new grad" OR "junior" software engineer',
+            'l': 'United States',
+            'fromage': '30',  # Last 30 days
+            'explvl': 'entry_level'
+        }
+        
+        response = self.fetch(url, params=params)
+        if not self.check_response(response, company):
+            return []
         
-        return []
+        return self._parse_indeed_jobs(response.text, company)
     
     def _search_glassdoor(self, company: str) -> List[Dict]:
         """Search Glassdoor for entry-level positions."""
-        try:
-            url = "https://www.glassdoor.com/Job/jobs.htm"
-            params = {
-                'sc.keyword': f'{company} entry level software engineer',
-                'locT': 'C',
-                'locId': '1',  # US
-                'seniorityType': 'entrylevel'
-            }
-            
-            time.sleep(1)  # Rate limiting
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                return self._parse_glassdoor_jobs(response.text, company)
-            
-        except Exception as e:
-            print(f"Glassdoor search failed for {company}: {e}")
+        url = "https://www.glassdoor.com/Job/jobs.htm"
+        params = {
+            'sc.keyword': f'{company} entry level software engineer',
+            'locT': 'C',
+            'locId': '1',  # US
+            'seniorityType': 'entrylevel'
+        }
+        
+        response = self.fetch(url, params=params)
+        if not self.check_response(response, company):
+            return []
         
-        return []
+        return self._parse_glassdoor_jobs(response.text, company)
     
     def _search_company_careers(self, company: str) -> List[Dict]:
         """Search company careers page directly."""
-        try:
-            # Common careers page patterns
-            career_urls = [
-                f"https://{company}.com/careers",
-                f"https://careers.{company}.com",
-                f"https://jobs.{company}.com",
-                f"https://www.{company}.com/jobs"
-            ]
-            
-            for url in career_urls:
-                try:
-                    time.sleep(1)
-                    response = self.session.get(url, timeout=self.timeout)
-                    if response.status_code == 200:
-                        return self._parse_careers_page(response.text, company, url)
-                except:
-                    continue
-            
-        except Exception as e:
-            print(f"Careers page search failed for {company}: {e}")
+        # Common careers page patterns
+        career_urls = [
+            f"https://{company}.com/careers",
+            f"https://careers.{company}.com",
+            f"https://jobs.{company}.com",
+            f"https://www.{company}.com/jobs"
+        ]
+        
+        # Try the guesses in order and stop at the first one that answers; this
+        # source already runs concurrently with the Indeed and Glassdoor searches
+        for url in career_urls:
+            html_content = self._fetch_careers_page(url)
+            if html_content is not None:
+                return self._parse_careers_page(html_content, company, url)
         
         return []
     
+    def _fetch_careers_page(self, url: str) -> Optional[str]:
+        """Return the page body if the careers URL exists, otherwise None.
+        
+        These are guesses, so any error just means there is no page here.
+        """
+        try:
+            response = self.fetch(url)
+            if response.status_code == 200:
+                return response.text
+        except Exception:
+            pass
+        return None
+    
     def _parse_indeed_jobs(self, html_content: str, company: str) -> List[Dict]:
         """Parse Indeed job listings."""
         import re
@@ -118,6 +124,7 @@ class JobRightProvider(BaseProvider):
                     'company': company,
                     'location': 'United States',
                     'url': f"https://www.indeed.com/viewjob?jk={job_id}",
+                    '_source_id': f"indeed:{job_id}",
                     'posted_date': datetime.now().isoformat(),
                     'provider': self.provider_name,
                     'description': f"Entry-level position at {company} via Indeed"
@@ -1,5 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from providers.base import BaseProvider
+from json_backend import load_records
+
+# The only posting fields this provider reads
+JOB_FIELDS = ('text', 'categories', 'hostedUrl', 'createdAt', 'description')
 
 class LeverProvider(BaseProvider):
     @property
@@ -9,32 +13,42 @@ class LeverProvider(BaseProvider):
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch jobs from Lever API."""
         try:
-            url = f"https://api.lever.co/v0/postings/{company}?mode=json"
-            response = self.session.get(url, timeout=self.timeout)
-            
-            if response.status_code != 200:
-                return []
+            return self.collect_pages(company)
+        except Exception as e:
+            print(f"Error fetching {company} from Lever: {e}")
+            return []
+    
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield Lever postings page by page using skip/limit."""
+        url = f"https://api.lever.co/v0/postings/{company}"
+        
+        for page in range(self.max_pages):
+            params = {'mode': 'json', 'skip': page * self.page_size, 'limit': self.page_size}
+            response = self.fetch(url, params=params)
             
-            data = response.json()
-            jobs = []
+            if not self.check_response(response, company):
+                return
             
-            for job in data:
-                location = job.get('categories', {}).get('location', '')
-                if isinstance(location, list):
-                    location = ', '.join(location)
-                
-                jobs.append({
-                    'title': job.get('text', ''),
-                    'company': company,
-                    'location': location,
-                    'url': job.get('hostedUrl', ''),
-                    'posted_date': job.get('createdAt', ''),
-                    'provider': self.provider_name,
-                    'description': job.get('description', '')
-                })
+            data = load_records(response.content, JOB_FIELDS)
+            if not data:
+                return
             
-            return jobs
+            yield [self._map_job(job, company) for job in data]
             
-        except Exception as e:
-            print(f"Error fetching {company} from Lever: {e}")
-            return []
\ No newline at end of file
+            if len(data) < self.page_size:
+                return
+    
+    def _map_job(self, job: Dict, company: str) -> Dict:
+        location = job.get('categories', {}).get('location', '')
+        if isinstance(location, list):
+            location = ', '.join(location)
+        
+        return {
+            'title': job.get('text', ''),
+            'company': company,
+            'location': location,
+            'url': job.get('hostedUrl', ''),
+            'posted_date': job.get('createdAt', ''),
+            'provider': self.provider_name,
+            'description': job.get('description', '')
+        }
@@ -1,7 +1,5 @@
-from typing import List, Dict
-import time
-import json
-from providers.base import BaseProvider
+from typing import List, Dict, Iterator
+from providers.base import BaseProvider, ProviderError
 
 class LinkedInProvider(BaseProvider):
     @property
@@ -11,49 +9,67 @@ class LinkedInProvider(BaseProvider):
     def get_jobs(self, company: str) -> List[Dict]:
         """Fetch jobs from LinkedIn via search API simulation."""
         try:
-            # LinkedIn job search for entry-level positions
-            search_terms = [
-                f"{company} software engineer entry level",
-                f"{company} new grad engineer",
-                f"{company} junior developer",
-                f"{company} associate engineer",
-                f"{company} cybersecurity analyst entry",
-                f"{company} security engineer junior"
-            ]
-            
-            jobs = []
-            
-            for term in search_terms:
-                # Simulate LinkedIn job search API
-                # Note: This is a simplified approach - real implementation would need LinkedIn API access
-                url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-                params = {
-                    'keywords': term,
-                    'location': 'United States',
-                    'f_TPR': 'r2592000',  # Last 30 days
-                    'f_E': '1,2',  # Entry level, Associate
-                    'start': 0
-                }
-                
-                # Add delay to respect rate limits
-                time.sleep(2)
-                
-                try:
-                    response = self.session.get(url, params=params, timeout=self.timeout)
-                    if response.status_code == 200:
-                        # Parse LinkedIn response (simplified)
-                        job_data = self._parse_linkedin_response(response.text, company)
-                        jobs.extend(job_data)
-                except Exception as e:
-                    print(f"LinkedIn search failed for {term}: {e}")
-                    continue
-            
-            return jobs[:10]  # Limit to 10 jobs per company
-            
+            return self.collect_pages(company)
         except Exception as e:
             print(f"Error fetching {company} from LinkedIn: {e}")
             return []
     
+    def iter_job_pages(self, company: str) -> Iterator[List[Dict]]:
+        """Yield one page of results per search offset, across all search terms.
+        
+        Raises ProviderError when searches fail and none of the rest return
+        anything, since that can't be told apart from an outage.
+        """
+        # LinkedIn job search for entry-level positions
+        search_terms = [
+            f"{company} software engineer entry level",
+            f"{company} new grad engineer",
+            f"{company} junior developer",
+            f"{company} associate engineer",
+            f"{company} cybersecurity analyst entry",
+            f"{company} security engineer junior"
+        ]
+        
+        seen = set()
+        
+        for page in range(self.max_pages):
+            start = page * self.page_size
+            results, errors = self.fan_out_settled(lambda term: self._search(term, company, start), search_terms)
+            for error in errors:
+                print(f"  LinkedIn search failed for {company} at offset {start}: {error}")
+            jobs = self.merge_unique(results, seen)
+            
+            if errors and not any(results):
+                raise ProviderError(f"{len(errors)} of {len(search_terms)} LinkedIn searches failed for {company} "
+                                    f"at offset {start} and the rest found nothing")
+            if not any(results):
+                return
+            
+            if jobs:
+                yield jobs
+    
+    def _search(self, term: str, company: str, start: int) -> List[Dict]:
+        """Run one search term at one offset."""
+        # Simulate LinkedIn job search API
+        # Note: This is a simplified approach - real implementation would need LinkedIn API access
+        url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        params = {
+            'keywords': term,
+            'location': 'United States',
+            'f_TPR': 'r2592000',  # Last 30 days
+            'f_E': '1,2',  # Entry level, Associate
+            'start': start
+        }
+        
+        # Rate limiting comes from the shared per-host concurrency limit;
+        # throttling and server errors raise ProviderError instead of looking empty
+        response = self.fetch(url, params=params)
+        if not self.check_response(response, company):
+            return []
+        
+        # Parse LinkedIn response (simplified)
+        return self._parse_linkedin_response(response.text, company)
+    
     def _parse_linkedin_response(self, html_content: str, company: str) -> List[Dict]:
         """Parse LinkedIn HTML response to extract job data."""
         import re
@@ -71,13 +87,14 @@ class LinkedInProvider(BaseProvider):
         titles = re.findall(title_pattern, html_content)
         locations = re.findall(location_pattern, html_content)
         
-        for i, job_id in enumerate(job_ids[:5]):  # Limit to 5 jobs
+        for i, job_id in enumerate(job_ids):
             if i < len(titles) and i < len(locations):
                 jobs.append({
                     'title': titles[i].strip(),
                     'company': company,
                     'location': locations[i].strip(),
                     'url': f"https://www.linkedin.com/jobs/view/{job_id}",
+                    '_source_id': f"linkedin:{job_id}",
                     'posted_date': datetime.now().isoformat(),
                     'provider': self.provider_name,
                     'description': f"Entry-level position at {company}"
@@ -0,0 +1,104 @@
+import re
+import json
+import hashlib
+from typing import Dict, List, Optional, Pattern
+from utils import is_us_location, classify_role_by_title
+
+# Labels for the job_titles sections in settings.yml; other sections use their title-cased key
+CATEGORY_LABELS = {
+    'software_engineering': 'SWE',
+    'cybersecurity': 'Cybersecurity'
+}
+
+def compile_keywords(keywords: List[str]) -> Optional[Pattern]:
+    """Compile keyword phrases into one case-insensitive, word-bounded alternation."""
+    if not keywords:
+        return None
+    # Longest first so overlapping phrases prefer the most specific match
+    phrases = sorted(set(keywords), key=len, reverse=True)
+    alternation = '|'.join(r'\s+'.join(re.escape(word) for word in phrase.split()) for phrase in phrases)
+    return re.compile(r'(?<!\w)(?:' + alternation + r')(?!\w)', re.IGNORECASE)
+
+def _validate_keywords(value, path: str) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"{path} must be a list of strings")
+    for i, keyword in enumerate(value):
+        if not isinstance(keyword, str) or not keyword.strip():
+            raise ValueError(f"{path}[{i}] must be a non-empty string")
+        if len(keyword.strip()) < 2:
+            raise ValueError(f"{path}[{i}] {keyword!r} is a single character and would match almost any text")
+    return [keyword.strip() for keyword in value]
+
+class RuleSet:
+    """Matchers compiled once from the 'filters' section of settings.yml."""
+
+    def __init__(self, filters: Dict):
+        if not isinstance(filters, dict):
+            raise ValueError("filters must be a mapping")
+
+        self.locations = _validate_keywords(filters.get('locations'), 'filters.locations')
+        self.experience_levels = _validate_keywords(filters.get('experience_levels'), 'filters.experience_levels')
+
+        job_titles = filters.get('job_titles') or {}
+        if not isinstance(job_titles, dict):
+            raise ValueError("filters.job_titles must be a mapping of category to titles")
+        self.job_titles = {
+            category: _validate_keywords(titles, f'filters.job_titles.{category}')
+            for category, titles in job_titles.items()
+        }
+
+        self.use_builtin_rules = filters.get('use_builtin_rules', True)
+        self.require_experience_level = filters.get('require_experience_level', False)
+        if self.require_experience_level and not self.experience_levels:
+            raise ValueError("filters.require_experience_level needs filters.experience_levels")
+
+        self.location_pattern = compile_keywords(self.locations)
+        self.experience_pattern = compile_keywords(self.experience_levels)
+        # Cybersecurity is tried first, as in classify_role_by_title, since security
+        # titles often contain SWE phrases ("Machine Learning Security Engineer")
+        self.title_patterns = [
+            (CATEGORY_LABELS.get(category, category.replace('_', ' ').title()), compile_keywords(titles))
+            for category, titles in sorted(self.job_titles.items(), key=lambda item: item[0] != 'cybersecurity')
+            if titles
+        ]
+
+        canonical = json.dumps(filters, sort_keys=True, default=str)
+        self.fingerprint = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_settings(cls, settings: Dict) -> 'RuleSet':
+        return cls(settings.get('filters') or {})
+
+    def matches_location(self, location: str) -> bool:
+        """Check location against the configured locations (and the built-in US check).
+        
+        A configured match is enough on its own, so filters.locations should only
+        hold phrases that imply a US location.
+        """
+        if not location:
+            return False
+        if self.use_builtin_rules and is_us_location(location):
+            return True
+        return bool(self.location_pattern and self.location_pattern.search(location))
+
+    def classify_title(self, title: str) -> Optional[str]:
+        """Return the first configured category whose titles match, else the built-in classification.
+        
+        With the built-in rules on, a built-in Cybersecurity match wins over any
+        configured category so security roles are never relabelled as SWE.
+        """
+        builtin = classify_role_by_title(title) if self.use_builtin_rules else None
+        if builtin == 'Cybersecurity':
+            return builtin
+        for label, pattern in self.title_patterns:
+            if pattern.search(title):
+                return label
+        return builtin
+
+    def matches_experience_level(self, title: str, description: str) -> bool:
+        """Check the configured experience levels when filters.require_experience_level is set."""
+        if not self.require_experience_level:
+            return True
+        return bool(self.experience_pattern.search(f"{title} {description}"))
@@ -1,24 +1,37 @@
 #!/usr/bin/env python3
 import os
 import sys
-import pandas as pd
-from typing import List, Dict
+import argparse
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils import load_yaml, save_json
+from utils import load_yaml
+from http_client import configure_client
+from analysis_cache import configure_analysis_cache
 from discovery import CompanyDiscovery
 from filters import JobFilter
-from providers.greenhouse import GreenhouseProvider
-from providers.lever import LeverProvider
-from providers.ashby import AshbyProvider
-from providers.linkedin import LinkedInProvider
-from providers.jobright import JobRightProvider
-from providers.experimental_jobright_like import ExperimentalJobrightLikeProvider
+from profiling import profiler
+from batch import JobBatch, FILTERED_COLUMNS
+from pipeline import build_providers, merge_discovered, scrape_board, finalize_jobs, write_outputs, LastGoodStore
 
 def main():
     """Main scraper execution."""
+    parser = argparse.ArgumentParser(description="Scrape entry-level tech jobs.")
+    parser.add_argument('--serve', action='store_true', help="run as a long-lived daemon with per-board refresh intervals")
+    parser.add_argument('--profile', nargs='?', const='profile', metavar='DIR',
+                        help="capture cProfile and tracemalloc data per pipeline stage into DIR (default: profile)")
+    parser.add_argument('--batch', action='store_true',
+                        help="filter, sort and serialize jobs as column-oriented batches (for large crawls)")
+    args = parser.parse_args()
+    
+    if args.profile and args.serve:
+        parser.error("--profile cannot be combined with --serve")
+    if args.batch and args.serve:
+        parser.error("--batch cannot be combined with --serve")
+    if args.profile:
+        profiler.start(args.profile)
+    
     print("Starting job scraper...")
     
     # Load configuration
@@ -26,30 +39,34 @@ def main():
     companies = load_yaml('companies.yml')
     
     # Initialize components
+    http_client = configure_client(settings.get('http', {}))
     discovery = CompanyDiscovery(settings)
     job_filter = JobFilter(settings)
+    print(f"Compiled filter rules (fingerprint {job_filter.rules.fingerprint[:12]})")
+    analysis_cache = configure_analysis_cache(settings.get('cache', {}), job_filter.rules.fingerprint)
+    providers = build_providers(settings)
+    
+    if args.serve:
+        from daemon import Daemon
+        last_good = LastGoodStore(settings.get('output', {}))
+        last_good.load()
+        Daemon(settings, companies, providers, discovery, job_filter, analysis_cache, last_good).serve()
+        return
     
     # Discover additional companies
     print("Discovering companies from GitHub lists...")
-    discovered = discovery.discover_companies()
-    
-    # Merge with guaranteed companies
-    for provider, company_list in discovered.items():
-        if provider in companies:
-            companies[provider].extend(company_list)
-            companies[provider] = list(set(companies[provider]))  # Remove duplicates
-    
-    # Initialize providers
-    providers = {
-        'greenhouse': GreenhouseProvider(settings['providers']['greenhouse']),
-        'lever': LeverProvider(settings['providers']['lever']),
-        'ashby': AshbyProvider(settings['providers']['ashby']),
-        'linkedin': LinkedInProvider(settings['providers']['linkedin']),
-        'jobright': JobRightProvider(settings['providers']['jobright']),
-        'experimental_jobright_like': ExperimentalJobrightLikeProvider(settings['providers']['experimental_jobright_like'])
-    }
-    
-    all_jobs = []
+    with profiler.stage('discovery'):
+        companies = merge_discovered(companies, discovery.discover_companies())
+    
+    filtered_jobs = []
+    filtered_batches = []
+    active_boards = []
+    failed_boards = []
+    last_good = LastGoodStore(settings.get('output', {}))
+    last_good.load()
+    
+    # Track filtering statistics
+    stats = {'fetched': 0, 'internships': 0, 'non_us': 0}
     
     # Scrape each provider
     for provider_name, provider in providers.items():
@@ -61,95 +78,60 @@ def main():
         print(f"Scraping {len(company_list)} companies from {provider_name}...")
         
         for company in company_list:
-            try:
-                jobs = provider.get_jobs(company)
-                if jobs:
-                    print(f"  OK {company}: {len(jobs)} jobs")
-                    all_jobs.extend(jobs)
-                else:
-                    print(f"  FAIL {company}: no jobs found")
-            except Exception as e:
-                print(f"  ERROR {company}: error - {e}")
-    
-    print(f"\nTotal jobs fetched: {len(all_jobs)}")
-    
-    # Filter jobs with detailed tracking
-    print("Filtering jobs...")
-    
-    # Track filtering statistics
-    total_jobs = len(all_jobs)
-    internship_count = 0
-    non_us_count = 0
-    
-    # Pre-filter to track rejections
-    from utils import has_internship_keywords, is_us_location, classify_role_by_title
-    
-    for job in all_jobs:
-        title = job.get('title', '')
-        location = job.get('location', '')
-        description = job.get('description', '')
-        
-        if has_internship_keywords(title, description):
-            internship_count += 1
-        elif not is_us_location(location):
-            non_us_count += 1
-    
-    filtered_jobs = job_filter.filter_jobs(all_jobs)
+            active_boards.append((provider_name, company))
+            with profiler.stage(f'fetch.{provider_name}'):
+                jobs = scrape_board(provider, company, job_filter, stats, use_batches=args.batch)
+            if jobs is None:
+                failed_boards.append((provider_name, company))
+            elif args.batch:
+                last_good.record_success(provider_name, company, jobs.to_records())
+                filtered_batches.append(jobs)
+            else:
+                last_good.record_success(provider_name, company, jobs)
+                filtered_jobs.extend(jobs)
+    
+    print(f"\nTotal jobs fetched: {stats['fetched']}")
+    
+    # Fall back to the last good jobs for boards that failed this run
+    if failed_boards:
+        recovered = 0
+        for provider_name, company in failed_boards:
+            jobs = last_good.recover(provider_name, company)
+            recovered += len(jobs)
+            filtered_jobs.extend(jobs)
+        print(f"{len(failed_boards)} boards failed; kept {recovered} jobs from their last good fetch")
+    
+    last_good.prune(active_boards)
+    
+    if args.batch:
+        filtered_jobs = JobBatch.concat(filtered_batches + [JobBatch.from_records(filtered_jobs, FILTERED_COLUMNS)], FILTERED_COLUMNS)
+        role_categories = filtered_jobs.frame['role_category'].tolist()
+    else:
+        role_categories = [job.get('role_category') for job in filtered_jobs]
     
     # Count final results by category
-    final_swe = sum(1 for job in filtered_jobs if job.get('role_category') == 'SWE')
-    final_cyber = sum(1 for job in filtered_jobs if job.get('role_category') == 'Cybersecurity')
-    
-    print(f"Kept {len(filtered_jobs)} US jobs (SWE: {final_swe}, Cyber: {final_cyber}). Skipped internships: {internship_count}, non-US: {non_us_count}.")
-    
-    # Ensure data directory exists
-    os.makedirs('data', exist_ok=True)
-    
-    # Sort by posted_date DESC, then company
-    from datetime import datetime, timezone
-    def sort_key(job):
-        posted_date = job.get('posted_date', '')
-        try:
-            if posted_date:
-                # Handle different date formats and ensure timezone awareness
-                if 'Z' in posted_date:
-                    date_obj = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
-                elif '+' in posted_date or '-' in posted_date[-6:]:
-                    date_obj = datetime.fromisoformat(posted_date)
-                else:
-                    # Assume UTC if no timezone info
-                    date_obj = datetime.fromisoformat(posted_date).replace(tzinfo=timezone.utc)
-                return (date_obj, job.get('company', ''))
-        except:
-            pass
-        return (datetime.min.replace(tzinfo=timezone.utc), job.get('company', ''))
-    
-    filtered_jobs.sort(key=sort_key, reverse=True)
-    
-    # Deduplicate by company + title + url
-    seen = set()
-    deduped_jobs = []
-    for job in filtered_jobs:
-        key = (job.get('company', ''), job.get('title', ''), job.get('url', ''))
-        if key not in seen:
-            seen.add(key)
-            deduped_jobs.append(job)
+    final_swe = role_categories.count('SWE')
+    final_cyber = role_categories.count('Cybersecurity')
     
+    print(f"Kept {len(filtered_jobs)} US jobs (SWE: {final_swe}, Cyber: {final_cyber}). Skipped internships: {stats['internships']}, non-US: {stats['non_us']}.")
+    
+    with profiler.stage('dedup'):
+        deduped_jobs = finalize_jobs(filtered_jobs)
     print(f"After deduplication: {len(deduped_jobs)} unique jobs")
     
     # Save results
     print("Saving results...")
-    save_json(deduped_jobs, 'data/jobs.json')
-    
-    # Save as CSV
-    if deduped_jobs:
-        df = pd.DataFrame(deduped_jobs)
-        df.to_csv('data/jobs.csv', index=False)
-        print(f"Saved {len(deduped_jobs)} jobs to data/jobs.json and data/jobs.csv")
-    else:
-        print("No jobs to save")
-    
+    with profiler.stage('serialize'):
+        write_outputs(deduped_jobs)
+    
+    # Caches are saved after the outputs so a full or unwritable .cache/ can't block them
+    last_good.save()
+    analysis_cache.save()
+    cache_stats = analysis_cache.stats()
+    print(f"Analysis cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['entries']} entries")
+    http_client.print_stats()
+    profiler.write()
     print("Scraping complete!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
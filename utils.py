@@ -1,6 +1,8 @@
 import re
-import json
 import yaml
+import json_backend
+from fileio import atomic_write
+from analysis_cache import analysis_cache
 from typing import List, Dict, Any
 
 def load_yaml(filepath: str) -> Dict[str, Any]:
@@ -9,9 +11,8 @@ def load_yaml(filepath: str) -> Dict[str, Any]:
         return yaml.safe_load(f)
 
 def save_json(data: List[Dict], filepath: str):
-    """Save data as JSON file."""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Atomically save data as JSON file using the fastest available JSON backend."""
+    atomic_write(filepath, json_backend.dumps(data, indent=True))
 
 def extract_domains_from_text(text: str) -> List[str]:
     """Extract company domains/names from markdown text."""
@@ -27,13 +28,29 @@ def extract_domains_from_text(text: str) -> List[str]:
         if len(company) > 2 and company not in ['github', 'linkedin', 'glassdoor']:
             domains.append(company)
     
-    return list(set(domains))
+    return sorted(set(domains))
 
 def normalize_company_name(name: str) -> str:
     """Normalize company name for API slugs."""
     import re
     return re.sub(r'[^a-zA-Z0-9]', '', name.lower())
 
+# Direct US indicators (substring match on the lowercased location)
+US_INDICATORS = ['united states', 'usa', 'u.s.', ' us ', 'remote (us)', 'us-remote', 'remote - united states']
+
+# US state codes
+US_STATES = [
+    'al', 'ak', 'az', 'ar', 'ca', 'co', 'ct', 'de', 'fl', 'ga', 'hi', 'id', 'il', 'in', 'ia', 'ks', 'ky', 'la', 'me', 'md',
+    'ma', 'mi', 'mn', 'ms', 'mo', 'mt', 'ne', 'nv', 'nh', 'nj', 'nm', 'ny', 'nc', 'nd', 'oh', 'ok', 'or', 'pa', 'ri', 'sc',
+    'sd', 'tn', 'tx', 'ut', 'vt', 'va', 'wa', 'wv', 'wi', 'wy', 'dc', 'pr'
+]
+
+# Substring match on the lowercased title + description
+INTERNSHIP_KEYWORDS = ['intern', 'internship', 'co-op', 'coop', 'apprentice', 'apprenticeship', 'fellow', 'fellowship']
+
+# Postings older than this are dropped
+MAX_POSTING_AGE_DAYS = 90
+
 def is_us_location(location: str) -> bool:
     """Check if location is US-based."""
     import re
@@ -41,20 +58,11 @@ def is_us_location(location: str) -> bool:
         return False
     location = location.lower().strip()
     
-    # Direct US indicators
-    us_indicators = ['united states', 'usa', 'u.s.', ' us ', 'remote (us)', 'us-remote', 'remote - united states']
-    if any(indicator in location for indicator in us_indicators):
+    if any(indicator in location for indicator in US_INDICATORS):
         return True
     
-    # US state codes
-    us_states = [
-        'al', 'ak', 'az', 'ar', 'ca', 'co', 'ct', 'de', 'fl', 'ga', 'hi', 'id', 'il', 'in', 'ia', 'ks', 'ky', 'la', 'me', 'md',
-        'ma', 'mi', 'mn', 'ms', 'mo', 'mt', 'ne', 'nv', 'nh', 'nj', 'nm', 'ny', 'nc', 'nd', 'oh', 'ok', 'or', 'pa', 'ri', 'sc',
-        'sd', 'tn', 'tx', 'ut', 'vt', 'va', 'wa', 'wv', 'wi', 'wy', 'dc', 'pr'
-    ]
-    
     # Check for "City, ST" pattern
-    state_pattern = r'\b(' + '|'.join(us_states) + r')\b'
+    state_pattern = r'\b(' + '|'.join(US_STATES) + r')\b'
     if re.search(state_pattern, location):
         return True
     
@@ -129,11 +137,14 @@ def classify_role_by_title(title: str) -> str:
 def has_internship_keywords(title: str, description: str) -> bool:
     """Check if job contains internship/co-op keywords."""
     text = f"{title} {description}".lower()
-    internship_keywords = ['intern', 'internship', 'co-op', 'coop', 'apprentice', 'apprenticeship', 'fellow', 'fellowship']
     # Allow 'trainee' and 'campus' as they might be full-time programs
-    return any(keyword in text for keyword in internship_keywords)
+    return any(keyword in text for keyword in INTERNSHIP_KEYWORDS)
 
 def analyze_experience_requirements(title: str, description: str) -> Dict[str, any]:
+    """Analyze experience requirements from title and description (memoized)."""
+    return analysis_cache.get_or_compute('experience', title, description, _analyze_experience_requirements)
+
+def _analyze_experience_requirements(title: str, description: str) -> Dict[str, any]:
     """Analyze experience requirements from title and description."""
     import re
     text = f"{title} {description}".lower()
@@ -209,42 +220,61 @@ def is_entry_level_job(title: str, description: str) -> bool:
     
     return False
 
-def is_relevant_job(job: Dict, settings: Dict) -> bool:
-    """Check if job matches criteria with strict entry-level filtering."""
-    from datetime import datetime, timedelta
+def is_relevant_job(job: Dict, settings: Dict, rules=None) -> bool:
+    """Check if job matches criteria with strict entry-level filtering.
     
+    rules is a compiled rules.RuleSet; without it only the built-in rules apply.
+    """
     title = job.get('title', '')
     location = job.get('location', '')
     description = job.get('description', '')
     
     # Check if job is within 3 months
-    posted_date = job.get('posted_date', '')
-    if posted_date:
-        try:
-            job_date = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
-            three_months_ago = datetime.now() - timedelta(days=90)
-            if job_date < three_months_ago:
-                return False
-        except:
-            pass
+    if not is_recent_posting(job.get('posted_date', '')):
+        return False
     
     # 1. Exclude internships first
     if has_internship_keywords(title, description):
         return False
     
     # 2. Check US location
-    if not is_us_location(location):
+    if not (rules.matches_location(location) if rules else is_us_location(location)):
         return False
     
-    # 3. Title-first classification
-    role_category = classify_role_by_title(title)
+    role_category = classify_relevant_role(title, description, rules)
     if not role_category:
         return False
     
+    # Store role category for later use
+    job['_role_category'] = role_category
+    return True
+
+def is_recent_posting(posted_date, now=None) -> bool:
+    """Check if a posting is within MAX_POSTING_AGE_DAYS; unparseable dates count as recent."""
+    from datetime import datetime, timedelta
+    
+    if posted_date:
+        try:
+            job_date = datetime.fromisoformat(posted_date.replace('Z', '+00:00'))
+            three_months_ago = (now or datetime.now()) - timedelta(days=MAX_POSTING_AGE_DAYS)
+            if job_date < three_months_ago:
+                return False
+        except:
+            pass
+    return True
+
+def classify_relevant_role(title: str, description: str, rules=None):
+    """Return the role category of an entry-level job, or None if it does not qualify."""
+    # 3. Title-first classification
+    role_category = rules.classify_title(title) if rules else classify_role_by_title(title)
+    if not role_category:
+        return None
+    
     # 4. STRICT entry-level confirmation
     if not is_entry_level_job(title, description):
-        return False
+        return None
     
-    # Store role category for later use
-    job['_role_category'] = role_category
-    return True
\ No newline at end of file
+    if rules and not rules.matches_experience_level(title, description):
+        return None
+    
+    return role_category
\ No newline at end of file